@@ -17,8 +17,12 @@ Usage:
 """
 
 import argparse
+import fnmatch
+import functools
 import json
+import mmap
 import os
+import re
 import sys
 import shutil
 from pathlib import Path
@@ -40,11 +44,18 @@ class Colors:
 def styled(text: str, *styles: str) -> str:
     return "".join(styles) + text + Colors.RESET
 
+# Chaînes statiques préformatées (évite de les reconstruire à chaque affichage)
+_BOLD_CYAN = Colors.BOLD + Colors.CYAN
+_BOLD_GREEN = Colors.BOLD + Colors.GREEN
+_BANNER_TOP = styled(f"\n{'=' * 60}", Colors.BLUE)
+_BANNER_BOTTOM = styled(f"{'=' * 60}\n", Colors.BLUE)
+
 # ─── Chemins ──────────────────────────────────────────────────────────────────
 
 PROFILES_DIR = Path.home() / ".claude-profiles"
 BUILTIN_PROFILES_DIR = Path(__file__).parent / "profiles"
 
+@functools.cache
 def get_profiles_dir() -> Path:
     """Retourne le dossier des profils utilisateur, ou les built-in si pas initialisé."""
     if PROFILES_DIR.exists():
@@ -57,23 +68,41 @@ def load_profile(name: str) -> dict:
     """Charge un profil depuis le dossier de profils."""
     profiles_dir = get_profiles_dir()
     profile_path = profiles_dir / f"{name}.json"
-    if not profile_path.exists():
+    try:
+        st = os.stat(profile_path)
+    except FileNotFoundError:
         print(styled(f"Profil '{name}' introuvable dans {profiles_dir}", Colors.RED))
         print(f"Profils disponibles : {', '.join(list_profiles())}")
         sys.exit(1)
-    with open(profile_path) as f:
-        return json.load(f)
+    return _load_profile_cached(str(profile_path), st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_profile_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse un fichier de profil ; la clé mtime invalide le cache si le fichier change."""
+    return json.loads(Path(path_str).read_bytes())
+
+
+# dossier -> (mtime_ns, profils) ; invalidé dès que le contenu du dossier change
+_profiles_cache: dict[Path, tuple[int, list[str]]] = {}
 
 
 def list_profiles() -> list[str]:
     """Liste tous les profils disponibles."""
     profiles_dir = get_profiles_dir()
-    if not profiles_dir.exists():
+    try:
+        mtime_ns = os.stat(profiles_dir).st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted([
-        p.stem for p in profiles_dir.glob("*.json")
-        if not p.name.startswith("_")
-    ])
+    cached = _profiles_cache.get(profiles_dir)
+    if cached is None or cached[0] != mtime_ns:
+        with os.scandir(profiles_dir) as it:
+            names = sorted(
+                e.name[:-len(".json")] for e in it
+                if e.name.endswith(".json") and not e.name.startswith("_")
+            )
+        cached = _profiles_cache[profiles_dir] = (mtime_ns, names)
+    return list(cached[1])
 
 # ─── Détection automatique du projet ─────────────────────────────────────────
 
@@ -108,74 +137,287 @@ DETECTION_RULES = [
 ]
 
 
-def detect_project(directory: str = ".") -> list[tuple[str, Optional[str]]]:
-    """Détecte le(s) type(s) de projet dans le répertoire donné."""
-    path = Path(directory).resolve()
-    detected = []
+def _index_markers() -> tuple[dict[str, list[int]], list[tuple[str, str, re.Pattern, int]]]:
+    """Sépare les marqueurs en noms littéraux (lookup dict) et motifs glob compilés.
 
-    for markers, profile, variant in DETECTION_RULES:
+    Chaque marqueur est associé à l'index de sa règle pour conserver l'ordre de priorité.
+    """
+    literals: dict[str, list[int]] = {}
+    globs: list[tuple[str, str, re.Pattern, int]] = []
+    for index, (markers, _profile, _variant) in enumerate(DETECTION_RULES):
         for marker in markers:
-            matches = list(path.glob(marker))
-            if matches:
-                entry = (profile, variant)
-                if entry not in detected:
-                    detected.append(entry)
+            if any(c in marker for c in "*?["):
+                subdir, _, name = marker.rpartition("/")
+                globs.append((subdir, name, re.compile(fnmatch.translate(name)), index))
+            else:
+                literals.setdefault(marker, []).append(index)
+    return literals, globs
+
+
+_Candidates = list[tuple[re.Pattern, int]]
+# Alternation compilée d'un seau (None s'il n'a qu'un motif) + ses motifs dans l'ordre des groupes
+_Bucket = tuple[Optional[re.Pattern], _Candidates]
+# Préfixe des groupes de l'alternation ; fnmatch.translate (3.10) génère déjà des groupes `g<n>`
+_UNION_GROUP = "marker_"
+
+
+def _union_globs(candidates: _Candidates) -> Optional[re.Pattern]:
+    """Compile les motifs d'un seau en une seule alternation nommée (None pour un seul motif).
+
+    Le groupe `marker_<i>` qui matche donne la position du motif dans le seau.
+    """
+    if len(candidates) == 1:
+        return None
+    return re.compile("|".join(
+        f"(?P<{_UNION_GROUP}{i}>{regex.pattern})" for i, (regex, _index) in enumerate(candidates)
+    ))
+
+
+def _bucket_globs(
+    globs: list[tuple[str, str, re.Pattern, int]],
+) -> tuple[dict[tuple[str, str], _Bucket], dict[tuple[str, str], _Bucket], dict[str, _Bucket]]:
+    """Range les motifs glob par (sous-dossier, extension) ou (sous-dossier, premier caractère).
+
+    `*.tsx` va dans l'index des extensions, `next.config.*` dans celui des premiers
+    caractères ; les autres motifs (ex: `*rc*`) restent testés pour tous les noms du dossier.
+    Un seau de plusieurs motifs est compilé en une alternation unique.
+    """
+    by_ext: dict[tuple[str, str], _Candidates] = {}
+    by_first_char: dict[tuple[str, str], _Candidates] = {}
+    unbucketed: dict[str, _Candidates] = {}
+    for subdir, pattern, regex, index in globs:
+        ext = pattern[1:]
+        if pattern.startswith("*.") and ext.count(".") == 1 and not any(c in ext for c in "*?["):
+            by_ext.setdefault((subdir, ext.lower()), []).append((regex, index))
+        elif pattern[0] not in "*?[":
+            by_first_char.setdefault((subdir, pattern[0]), []).append((regex, index))
+        else:
+            unbucketed.setdefault(subdir, []).append((regex, index))
+    return tuple(
+        {key: (_union_globs(candidates), candidates) for key, candidates in buckets.items()}
+        for buckets in (by_ext, by_first_char, unbucketed)
+    )
+
+
+def _fold_literals(literals: dict[str, list[int]]) -> dict[str, list[int]]:
+    """Même index en casse repliée, pour les systèmes de fichiers insensibles à la casse (macOS, Windows)."""
+    folded: dict[str, list[int]] = {}
+    for marker, indexes in literals.items():
+        folded.setdefault(marker.casefold(), []).extend(indexes)
+    return folded
+
+
+LITERAL_MARKERS, GLOB_MARKERS = _index_markers()
+FOLDED_LITERAL_MARKERS = _fold_literals(LITERAL_MARKERS)
+EXT_INDEX, FIRST_CHAR_INDEX, UNBUCKETED_GLOBS = _bucket_globs(GLOB_MARKERS)
+
+
+def _first_rule_by_dir() -> dict[str, int]:
+    """Associe chaque sous-dossier à lister ("" = racine) à l'index de la première règle qui le concerne."""
+    first: dict[str, int] = {}
+    for index, (markers, _profile, _variant) in enumerate(DETECTION_RULES):
+        for marker in markers:
+            first.setdefault(marker.rpartition("/")[0], index)
+    return dict(sorted(first.items()))
+
+
+MARKER_DIRS = _first_rule_by_dir()
+
+
+def _scan_names(path: Path) -> list[str]:
+    """Liste les noms du dossier en un seul appel scandir (vide si absent).
+
+    Les liens symboliques cassés sont ignorés, comme le faisait Path.exists().
+    """
+    try:
+        with os.scandir(path) as it:
+            return [e.name for e in it if not e.is_symlink() or os.path.exists(e.path)]
+    except OSError:
+        return []
+
+
+def _is_case_insensitive(path: Path, names: list[str]) -> bool:
+    """Devine si le dossier ignore la casse en testant une entrée listée avec la casse inversée.
+
+    Path.exists() suivait les règles du système de fichiers : `makefile` valait `Makefile`
+    sur macOS. Une seule sonde par dossier suffit à reproduire ce comportement.
+    """
+    listed = set(names)
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name and swapped not in listed:
+            return os.path.exists(path / swapped)
+    return False
+
+
+def _marker_names(path: Path) -> set[str]:
+    """Noms du dossier pour des tests d'appartenance, repliés si le système de fichiers ignore la casse."""
+    names = _scan_names(path)
+    if _is_case_insensitive(path, names):
+        return {name.casefold() for name in names}
+    return set(names)
+
+
+def detect_project(path: Path, first_only: bool = False) -> list[tuple[str, Optional[str]]]:
+    """Détecte le(s) type(s) de projet dans le répertoire donné (chemin déjà résolu).
+
+    Avec first_only, s'arrête dès que le profil le plus prioritaire est certain.
+    """
+    matched: set[int] = set()
+
+    for subdir, first_rule in MARKER_DIRS.items():
+        # Ce dossier ne peut plus fournir de règle plus prioritaire que celle déjà trouvée
+        if first_only and matched and min(matched) <= first_rule:
+            continue
+        unbucketed = UNBUCKETED_GLOBS.get(subdir)
+        dir_path = path / subdir if subdir else path
+        names = _scan_names(dir_path)
+        # Les motifs glob restent sensibles à la casse, comme avec Path.glob
+        folded = _is_case_insensitive(dir_path, names)
+        literals = FOLDED_LITERAL_MARKERS if folded else LITERAL_MARKERS
+        for name in names:
+            if first_only and first_rule in matched:
                 break
+            key = name.casefold() if folded else name
+            matched.update(literals.get(f"{subdir}/{key}" if subdir else key, ()))
+            # Seuls les motifs glob pouvant correspondre à ce nom sont testés
+            dot = name.rfind(".")
+            by_ext = EXT_INDEX.get((subdir, name[dot:].lower())) if dot >= 0 else None
+            for bucket in (by_ext, FIRST_CHAR_INDEX.get((subdir, name[:1])), unbucketed):
+                if bucket is None:
+                    continue
+                union, candidates = bucket
+                if union is None or all(index in matched for _, index in candidates):
+                    for regex, index in candidates:
+                        if index not in matched and regex.match(name):
+                            matched.add(index)
+                    continue
+                m = union.match(name)
+                if m:
+                    first = int(m.lastgroup[len(_UNION_GROUP):])
+                    matched.add(candidates[first][1])
+                    # L'alternation ne rapporte que le premier motif : on vérifie ceux qui suivent
+                    for regex, index in candidates[first + 1:]:
+                        if index not in matched and regex.match(name):
+                            matched.add(index)
+
+    detected = []
+    for index in sorted(matched):
+        _, profile, variant = DETECTION_RULES[index]
+        entry = (profile, variant)
+        if entry not in detected:
+            detected.append(entry)
+        if first_only:
+            break
 
     return detected
 
 
-def detect_variant(profile_name: str, directory: str = ".") -> Optional[str]:
-    """Détecte la variante spécifique d'un profil (ex: maven vs gradle pour Java)."""
-    path = Path(directory).resolve()
+_FASTAPI_RE = re.compile(rb"(?i)fastapi")
+
 
+@functools.lru_cache(maxsize=8)
+def _read_package_json(path_str: str, mtime_ns: int, size: int) -> frozenset[str]:
+    """Retourne les noms des dépendances (dev incluses) d'un package.json, parsé une seule fois par (mtime, taille)."""
+    data = Path(path_str).read_bytes()
+    # Pré-filtre : sans aucune section de dépendances, inutile de parser (aucune variante possible)
+    if b'"dependencies"' not in data and b'"devDependencies"' not in data:
+        return frozenset()
+    pkg = json.loads(data)
+    return frozenset(pkg.get("dependencies", {}).keys() | pkg.get("devDependencies", {}).keys())
+
+
+def detect_variant(profile_name: str, path: Path) -> Optional[str]:
+    """Détecte la variante spécifique d'un profil (ex: maven vs gradle pour Java)."""
     if profile_name == "java":
-        if list(path.glob("pom.xml")):
+        names = _marker_names(path)
+        if "pom.xml" in names:
             return "maven"
-        if list(path.glob("build.gradle")) or list(path.glob("build.gradle.kts")) or list(path.glob("gradlew")):
+        if "build.gradle" in names or "build.gradle.kts" in names or "gradlew" in names:
             return "gradle"
 
     if profile_name in ("typescript-react", "typescript-node", "javascript-node"):
         pkg_path = path / "package.json"
-        if pkg_path.exists():
+        try:
+            # Un seul stat : sert de test d'existence et de clé de cache
+            st = os.stat(pkg_path)
+        except OSError:
+            st = None
+        if st is not None:
             try:
-                pkg = json.loads(pkg_path.read_text())
-                deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-                if "next" in deps:
+                dep_keys = _read_package_json(str(pkg_path), st.st_mtime_ns, st.st_size)
+                if "next" in dep_keys:
                     return "nextjs"
-                if "react" in deps:
+                if "react" in dep_keys:
                     return "react"
-                if "vue" in deps:
+                if "vue" in dep_keys:
                     return "vue"
-                if "svelte" in deps or "@sveltejs/kit" in deps:
+                if "svelte" in dep_keys or "@sveltejs/kit" in dep_keys:
                     return "svelte"
-                if "express" in deps or "fastify" in deps or "koa" in deps:
+                if "express" in dep_keys or "fastify" in dep_keys or "koa" in dep_keys:
                     return "api"
             except (json.JSONDecodeError, KeyError):
                 pass
 
     if profile_name == "python":
-        if list(path.glob("manage.py")):
+        names = _marker_names(path)
+        if "manage.py" in names:
             return "django"
-        if list(path.glob("app.py")) or list(path.glob("wsgi.py")):
+        if "app.py" in names or "wsgi.py" in names:
             return "flask"
-        if (path / "pyproject.toml").exists():
-            content = (path / "pyproject.toml").read_text()
-            if "fastapi" in content.lower():
-                return "fastapi"
+        if "pyproject.toml" in names:
+            with open(path / "pyproject.toml", "rb") as f:
+                # mmap refuse les fichiers vides
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if _FASTAPI_RE.search(mm):
+                            return "fastapi"
 
     return None
 
 # ─── Application d'un profil ─────────────────────────────────────────────────
 
-def apply_profile(profile_name: str, variant: Optional[str] = None, directory: str = ".", dry_run: bool = False):
-    """Applique un profil au répertoire courant."""
+def _same_content(data: bytes, chunks: tuple[bytes, ...]) -> bool:
+    """Compare le contenu existant aux morceaux à écrire, sans les concaténer."""
+    if len(data) != sum(map(len, chunks)):
+        return False
+    offset = 0
+    for chunk in chunks:
+        if not data.startswith(chunk, offset):
+            return False
+        offset += len(chunk)
+    return True
+
+
+def _read_if_exists(path: Path) -> Optional[bytes]:
+    """Retourne le contenu du fichier, ou None s'il n'existe pas."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_chunks(path: Path, chunks: tuple[bytes, ...]):
+    with open(path, "wb") as f:
+        f.writelines(chunks)
+
+
+def _write_if_changed(path: Path, *chunks: bytes):
+    """Écrit les morceaux dans le fichier seulement si son contenu diffère."""
+    existing = _read_if_exists(path)
+    if existing is None or not _same_content(existing, chunks):
+        _write_chunks(path, chunks)
+
+
+def apply_profile(profile_name: str, variant: Optional[str] = None, path: Optional[Path] = None, dry_run: bool = False):
+    """Applique un profil au répertoire donné (chemin déjà résolu), ou au répertoire courant."""
+    if path is None:
+        path = Path.cwd()
     profile = load_profile(profile_name)
-    path = Path(directory).resolve()
 
     # Résoudre la variante
     if variant is None:
-        variant = detect_variant(profile_name, directory)
+        variant = detect_variant(profile_name, path)
 
     variant_config = {}
     if variant and "variants" in profile:
@@ -185,10 +427,10 @@ def apply_profile(profile_name: str, variant: Optional[str] = None, directory: s
     if variant:
         display_name += f" ({variant})"
 
-    print(styled(f"\n{'=' * 60}", Colors.BLUE))
-    print(styled(f"  Profil : {display_name}", Colors.BOLD, Colors.CYAN))
+    print(_BANNER_TOP)
+    print(styled(f"  Profil : {display_name}", _BOLD_CYAN))
     print(styled(f"  Cible  : {path}", Colors.DIM))
-    print(styled(f"{'=' * 60}\n", Colors.BLUE))
+    print(_BANNER_BOTTOM)
 
     if dry_run:
         print(styled("  [MODE DRY-RUN] Aucun fichier ne sera modifié\n", Colors.YELLOW))
@@ -203,7 +445,7 @@ def apply_profile(profile_name: str, variant: Optional[str] = None, directory: s
             print(styled(f"  + mkdir {d}/", Colors.GREEN))
 
     # 2. Générer .mcp.json
-    mcp_servers = {**profile.get("mcp_servers", {})}
+    mcp_servers = profile.get("mcp_servers", {}).copy()
     # Fusionner les MCP de la variante
     if variant_config.get("mcp_servers"):
         mcp_servers.update(variant_config["mcp_servers"])
@@ -215,7 +457,7 @@ def apply_profile(profile_name: str, variant: Optional[str] = None, directory: s
         mcp_json = {"mcpServers": mcp_servers}
         mcp_path = path / ".mcp.json"
         if not dry_run:
-            mcp_path.write_text(json.dumps(mcp_json, indent=2) + "\n")
+            _write_if_changed(mcp_path, json.dumps(mcp_json, indent=2).encode(), b"\n")
         print(styled(f"  + .mcp.json", Colors.GREEN) + f" ({len(mcp_servers)} serveurs MCP)")
         for name in mcp_servers:
             print(styled(f"      - {name}", Colors.DIM))
@@ -227,39 +469,48 @@ def apply_profile(profile_name: str, variant: Optional[str] = None, directory: s
 
     if claude_md:
         claude_md_path = path / ".claude" / "CLAUDE.md"
-        if claude_md_path.exists():
+        claude_md_chunks = (claude_md.encode(), b"\n")
+        existing = _read_if_exists(claude_md_path)
+        unchanged = existing is not None and _same_content(existing, claude_md_chunks)
+        # Contenu identique : ni sauvegarde (qui écraserait le .bak précédent) ni réécriture
+        if existing is not None and not unchanged:
             print(styled(f"  ~ .claude/CLAUDE.md existe déjà, sauvegarde en .claude/CLAUDE.md.bak", Colors.YELLOW))
             if not dry_run:
                 shutil.copy2(claude_md_path, claude_md_path.with_suffix(".md.bak"))
-        if not dry_run:
-            claude_md_path.write_text(claude_md + "\n")
+        if not dry_run and not unchanged:
+            _write_chunks(claude_md_path, claude_md_chunks)
         print(styled(f"  + .claude/CLAUDE.md", Colors.GREEN))
 
     # 4. Générer les rules
-    rules = {**profile.get("rules", {})}
+    rules = profile.get("rules", {}).copy()
     if variant_config.get("rules"):
         rules.update(variant_config["rules"])
 
     for rule_name, rule_content in rules.items():
         rule_path = path / ".claude" / "rules" / f"{rule_name}.md"
         if not dry_run:
-            rule_path.write_text(rule_content + "\n")
+            _write_if_changed(rule_path, rule_content.encode(), b"\n")
         print(styled(f"  + .claude/rules/{rule_name}.md", Colors.GREEN))
 
     # 5. Générer les skills
-    skills = {**profile.get("skills", {})}
+    skills = profile.get("skills", {}).copy()
     if variant_config.get("skills"):
         skills.update(variant_config["skills"])
 
+    # .claude/skills/ existe déjà (étape 1) : un simple mkdir par skill suffit
     for skill_name, skill_content in skills.items():
         skill_dir = path / ".claude" / "skills" / skill_name
         if not dry_run:
-            skill_dir.mkdir(parents=True, exist_ok=True)
-            (skill_dir / "SKILL.md").write_text(skill_content + "\n")
+            try:
+                os.mkdir(skill_dir)
+            except FileExistsError:
+                pass
+            _write_if_changed(skill_dir / "SKILL.md", skill_content.encode(), b"\n")
         print(styled(f"  + .claude/skills/{skill_name}/SKILL.md", Colors.GREEN))
 
     # 6. Générer settings.json
-    settings = profile.get("settings", {})
+    # Copie : le profil chargé est partagé via le cache de load_profile
+    settings = profile.get("settings", {}).copy()
     if variant_config.get("settings_merge"):
         # Fusion simple (1 niveau)
         for key, val in variant_config["settings_merge"].items():
@@ -271,36 +522,38 @@ def apply_profile(profile_name: str, variant: Optional[str] = None, directory: s
     if settings:
         settings_path = path / ".claude" / "settings.json"
         if not dry_run:
-            settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+            _write_if_changed(settings_path, json.dumps(settings, indent=2).encode(), b"\n")
         print(styled(f"  + .claude/settings.json", Colors.GREEN))
 
     # 7. Mettre à jour .gitignore
     gitignore_entries = [
-        ".claude/settings.local.json",
-        ".claude/CLAUDE.local.md",
+        b".claude/settings.local.json",
+        b".claude/CLAUDE.local.md",
     ]
     gitignore_path = path / ".gitignore"
-    existing_gitignore = ""
+    existing_lines = set()
     if gitignore_path.exists():
-        existing_gitignore = gitignore_path.read_text()
+        with open(gitignore_path, "rb") as f:
+            # Comparaison ligne à ligne, comme git : espaces finaux ignorés, et
+            # "/.claude/x" équivaut à ".claude/x" (motif déjà ancré par son "/")
+            existing_lines = {line.rstrip().removeprefix(b"/") for line in f.read().splitlines()}
 
-    new_entries = [e for e in gitignore_entries if e not in existing_gitignore]
+    new_entries = [e for e in gitignore_entries if e not in existing_lines]
     if new_entries:
         if not dry_run:
-            with open(gitignore_path, "a") as f:
-                f.write("\n# Claude Code (local)\n")
-                for entry in new_entries:
-                    f.write(entry + "\n")
+            with open(gitignore_path, "ab") as f:
+                f.write(b"\n# Claude Code (local)\n" + b"\n".join(new_entries) + b"\n")
         print(styled(f"  + .gitignore (ajout entrées Claude)", Colors.GREEN))
 
-    print(styled(f"\n  Profil '{display_name}' appliqué avec succès !", Colors.BOLD, Colors.GREEN))
+    print(styled(f"\n  Profil '{display_name}' appliqué avec succès !", _BOLD_GREEN))
     print(styled(f"  Tu peux personnaliser avec .claude/CLAUDE.local.md et .claude/settings.local.json\n", Colors.DIM))
 
 # ─── Commandes CLI ────────────────────────────────────────────────────────────
 
 def cmd_detect(args):
     """Commande: détecter le type de projet."""
-    detected = detect_project(args.directory)
+    path = Path(args.directory).resolve()
+    detected = detect_project(path)
     if not detected:
         print(styled("Aucun type de projet détecté dans ce répertoire.", Colors.YELLOW))
         print("Utilise `claude-profiles list` pour voir les profils disponibles.")
@@ -308,7 +561,7 @@ def cmd_detect(args):
 
     print(styled("\nProjets détectés :\n", Colors.BOLD))
     for profile, variant in detected:
-        auto_variant = variant or detect_variant(profile, args.directory)
+        auto_variant = variant or detect_variant(profile, path)
         label = profile
         if auto_variant:
             label += styled(f" ({auto_variant})", Colors.DIM)
@@ -316,7 +569,7 @@ def cmd_detect(args):
 
     if len(detected) == 1:
         profile, variant = detected[0]
-        auto_variant = variant or detect_variant(profile, args.directory)
+        auto_variant = variant or detect_variant(profile, path)
         v_str = f" --variant {auto_variant}" if auto_variant else ""
         print(styled(f"\nAppliquer : claude-profiles apply {profile}{v_str}\n", Colors.DIM))
 
@@ -352,10 +605,10 @@ def cmd_show(args):
     display = profile.get("display_name", args.profile)
     desc = profile.get("description", "")
 
-    print(styled(f"\n{'=' * 60}", Colors.BLUE))
-    print(styled(f"  {display}", Colors.BOLD, Colors.CYAN))
+    print(_BANNER_TOP)
+    print(styled(f"  {display}", _BOLD_CYAN))
     print(styled(f"  {desc}", Colors.DIM))
-    print(styled(f"{'=' * 60}\n", Colors.BLUE))
+    print(_BANNER_BOTTOM)
 
     # MCP Servers
     mcps = profile.get("mcp_servers", {})
@@ -403,20 +656,20 @@ def cmd_apply(args):
     """Commande: appliquer un profil."""
     profile_name = args.profile
     variant = args.variant
-    directory = args.directory
+    path = Path(args.directory).resolve()
 
     if profile_name == "auto":
-        detected = detect_project(directory)
+        detected = detect_project(path, first_only=True)
         if not detected:
             print(styled("Impossible de détecter le type de projet.", Colors.RED))
             print("Utilise `claude-profiles list` pour voir les profils disponibles.")
             sys.exit(1)
         profile_name, variant = detected[0]
         if variant is None:
-            variant = detect_variant(profile_name, directory)
+            variant = detect_variant(profile_name, path)
         print(styled(f"  Auto-détecté : {profile_name}" + (f" ({variant})" if variant else ""), Colors.CYAN))
 
-    apply_profile(profile_name, variant, directory, dry_run=args.dry_run)
+    apply_profile(profile_name, variant, path, dry_run=args.dry_run)
 
 
 def cmd_init(args):
@@ -433,18 +686,17 @@ def cmd_init(args):
         shutil.copy2(profile_file, dest)
         print(styled(f"  + {profile_file.name}", Colors.GREEN))
 
-    print(styled(f"\nProfils initialisés dans {PROFILES_DIR}", Colors.BOLD, Colors.GREEN))
+    print(styled(f"\nProfils initialisés dans {PROFILES_DIR}", _BOLD_GREEN))
     print(styled(f"Tu peux les personnaliser en éditant les fichiers JSON.\n", Colors.DIM))
 
 
 def cmd_diff(args):
     """Commande: comparer la config actuelle avec un profil."""
     profile_name = args.profile
-    directory = args.directory
-    path = Path(directory).resolve()
+    path = Path(args.directory).resolve()
 
     if profile_name == "auto":
-        detected = detect_project(directory)
+        detected = detect_project(path, first_only=True)
         if not detected:
             print(styled("Impossible de détecter le type de projet.", Colors.RED))
             sys.exit(1)
@@ -457,7 +709,7 @@ def cmd_diff(args):
     # Vérifier .mcp.json
     mcp_path = path / ".mcp.json"
     if mcp_path.exists():
-        current_mcps = json.loads(mcp_path.read_text()).get("mcpServers", {})
+        current_mcps = json.loads(mcp_path.read_bytes()).get("mcpServers", {})
         profile_mcps = profile.get("mcp_servers", {})
         missing = set(profile_mcps.keys()) - set(current_mcps.keys())
         extra = set(current_mcps.keys()) - set(profile_mcps.keys())